@@ -0,0 +1,113 @@
+"""
+Tests for the batch (N, 2) array versions of the math functions, checked
+against the scalar versions that work on tuples.
+"""
+import unittest
+from math import pi
+
+import numpy as np
+
+from vec2d.math import (
+    length,
+    perimeter,
+    rescale,
+    rotate,
+    to_cartesian,
+    to_polar,
+    translate,
+)
+
+VECTORS = [(3, 4), (-1, 2), (0, 0), (-2.5, -1.5), (1, -1), (-4, 0)]
+
+
+class TestBatchVectorMath(unittest.TestCase):
+    """Checks each batch kernel against the scalar path."""
+
+    def setUp(self) -> None:
+        self.batch = np.array(VECTORS, dtype=float)
+        self.empty = np.empty((0, 2))
+
+    def test_length(self):
+        np.testing.assert_allclose(
+            length(self.batch), [length(v) for v in VECTORS]
+        )
+
+    def test_length_empty(self):
+        self.assertEqual(length(self.empty).shape, (0,))
+
+    def test_length_int_array(self):
+        np.testing.assert_allclose(length(np.array([[3, 4]])), [5.0])
+
+    def test_perimeter(self):
+        self.assertAlmostEqual(perimeter(self.batch), perimeter(VECTORS))
+
+    def test_perimeter_empty(self):
+        self.assertEqual(perimeter(self.empty), 0)
+
+    def test_rotate(self):
+        np.testing.assert_allclose(
+            rotate(pi / 3, self.batch), rotate(pi / 3, VECTORS), atol=1e-12
+        )
+
+    def test_rotate_empty(self):
+        with self.assertRaises(ValueError):
+            rotate(pi / 3, self.empty)
+
+    def test_to_polar(self):
+        np.testing.assert_allclose(
+            to_polar(self.batch), [to_polar(v) for v in VECTORS]
+        )
+
+    def test_to_polar_positive_angle(self):
+        polar = to_polar(self.batch, positive_angle=True)
+        np.testing.assert_allclose(
+            polar, [to_polar(v, positive_angle=True) for v in VECTORS]
+        )
+        self.assertTrue((polar[:, 1] >= 0).all())
+
+    def test_to_polar_empty(self):
+        self.assertEqual(to_polar(self.empty).shape, (0, 2))
+
+    def test_to_cartesian(self):
+        polar = [to_polar(v) for v in VECTORS]
+        np.testing.assert_allclose(
+            to_cartesian(np.array(polar)),
+            [to_cartesian(v) for v in polar],
+            atol=1e-12,
+        )
+
+    def test_to_cartesian_empty(self):
+        self.assertEqual(to_cartesian(self.empty).shape, (0, 2))
+
+    def test_translate(self):
+        np.testing.assert_allclose(
+            translate((1, -2), self.batch), translate((1, -2), VECTORS)
+        )
+
+    def test_rescale(self):
+        np.testing.assert_allclose(
+            rescale(2.5, self.batch), rescale(2.5, VECTORS)
+        )
+
+    def test_invalid_shape(self):
+        for func in (length, perimeter, to_polar, to_cartesian):
+            with self.subTest(func=func.__name__):
+                with self.assertRaises(ValueError):
+                    func(np.ones((2, 3)))
+
+    def test_invalid_collection_shape(self):
+        collection_funcs = {
+            "perimeter": perimeter,
+            "rotate": lambda v: rotate(pi, v),
+            "translate": lambda v: translate((1, 1), v),
+            "rescale": lambda v: rescale(2, v),
+        }
+        for name, func in collection_funcs.items():
+            for vectors in (np.ones((2, 3)), np.array([1.0, 2.0])):
+                with self.subTest(func=name, shape=vectors.shape):
+                    with self.assertRaises(ValueError):
+                        func(vectors)
+
+
+if __name__ == "__main__":
+    unittest.main()
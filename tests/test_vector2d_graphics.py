@@ -0,0 +1,240 @@
+"""
+Tests for the figures and the draw() function of the vec2d.graph module,
+rendered with the non-interactive Agg backend.
+"""
+import os
+import tempfile
+import unittest
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+# pylint: disable=wrong-import-position
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import (
+    LineCollection,
+    PatchCollection,
+    PathCollection,
+    PolyCollection,
+)
+from matplotlib.colors import to_rgba, to_rgba_array
+
+from vec2d.graph import Arrow, Points, Polygon, Segment, draw
+
+
+class TestPoints(unittest.TestCase):
+    """Tests for the rendering of Points figures."""
+
+    def tearDown(self) -> None:
+        plt.close("all")
+
+    def test_per_point_colors(self):
+        Points((1, 2), (3, 4), (5, 6), color=["r", "g", "b"]).render()
+        (scatter,) = plt.gca().collections
+        np.testing.assert_allclose(
+            scatter.get_facecolors(), to_rgba_array(["r", "g", "b"])
+        )
+
+    def test_colormap_colors(self):
+        colors = plt.cm.viridis(np.linspace(0, 1, 3))
+        Points((1, 2), (3, 4), (5, 6), color=colors).render()
+        (scatter,) = plt.gca().collections
+        np.testing.assert_allclose(scatter.get_facecolors(), colors)
+
+    def test_single_color_is_repeated(self):
+        Points((1, 2), (3, 4), color="r").render()
+        (scatter,) = plt.gca().collections
+        np.testing.assert_allclose(
+            scatter.get_facecolors(), [to_rgba("r")] * 2
+        )
+
+    def test_empty(self):
+        self.assertEqual(Points().extract_vectors().shape, (0, 2))
+
+    def test_malformed_vectors(self):
+        with self.assertRaises(ValueError):
+            Points((1, 2, 3, 4))
+
+    def test_extract_vectors_is_read_only(self):
+        points = Points((1, 2), (3, 4))
+        with self.assertRaises(ValueError):
+            points.extract_vectors()[0, 0] = 5
+        np.testing.assert_array_equal(
+            points.extract_vectors(), [[1, 2], [3, 4]]
+        )
+
+    def test_mismatched_colors(self):
+        with self.assertRaises(ValueError):
+            Points((1, 2), (3, 4), color=["r", "g", "b"]).render()
+
+    def test_default_color_follows_cycle(self):
+        Points((1, 2), color=None).render()
+        (scatter,) = plt.gca().collections
+        np.testing.assert_allclose(scatter.get_facecolors(), [to_rgba("C0")])
+
+    def test_vectors_setter_resyncs(self):
+        points = Points((1, 2))
+        points.vectors = ((3, 4), (5, 6))
+        np.testing.assert_array_equal(
+            points.extract_vectors(), [[3, 4], [5, 6]]
+        )
+
+
+class TestSegment(unittest.TestCase):
+    """Tests for the rendering of Segment figures."""
+
+    def tearDown(self) -> None:
+        plt.close("all")
+
+    def test_default_linestyle(self):
+        Segment((0, 0), (1, 1), linestyle=None).render()
+        (line,) = plt.gca().collections
+        self.assertEqual(line.get_linestyle(), [(0, None)])
+
+    def test_malformed_vectors(self):
+        with self.assertRaises(ValueError):
+            Segment((1, 2, 3), (4, 5, 6))
+
+    def test_default_colors_follow_cycle(self):
+        Segment.render_all(
+            [Segment((0, 0), (1, 1), color=None) for _ in range(2)], {}
+        )
+        (line,) = plt.gca().collections
+        np.testing.assert_allclose(
+            line.get_colors(), to_rgba_array(["C0", "C1"])
+        )
+
+    def test_points_setters_resync(self):
+        segment = Segment((0, 0), (1, 1))
+        segment.start_point = (2, 3)
+        segment.end_point = (4, 5)
+        np.testing.assert_array_equal(
+            segment.extract_vectors(), [[2, 3], [4, 5]]
+        )
+        segment.render()
+        (line,) = plt.gca().collections
+        np.testing.assert_array_equal(line.get_segments(), [[[2, 3], [4, 5]]])
+
+    def test_render_on_given_axes(self):
+        _, (ax1, ax2) = plt.subplots(1, 2)
+        Segment((0, 0), (1, 1)).render({"ax": ax2})
+        self.assertEqual(len(ax1.collections), 0)
+        self.assertEqual(len(ax2.collections), 1)
+
+
+class TestPolygon(unittest.TestCase):
+    """Tests for the rendering of Polygon figures."""
+
+    def tearDown(self) -> None:
+        plt.close("all")
+
+    def test_default_linestyle(self):
+        Polygon((0, 0), (1, 0), (0, 1), linestyle=None).render()
+        (outline,) = plt.gca().collections
+        self.assertEqual(len(outline.get_segments()), 3)
+        self.assertEqual(outline.get_linestyle(), [(0, None)] * 3)
+
+    def test_fill_alpha(self):
+        Polygon((0, 0), (1, 0), (0, 1), fill="r", alpha=0.25).render()
+        fill = next(
+            c for c in plt.gca().collections if isinstance(c, PolyCollection)
+        )
+        np.testing.assert_allclose(
+            fill.get_facecolors(), [to_rgba("r", 0.25)]
+        )
+
+    def test_vertices_setter_resyncs(self):
+        polygon = Polygon((0, 0), (1, 0), (0, 1))
+        polygon.vertices = ((0, 0), (2, 0), (2, 2), (0, 2))
+        polygon.render()
+        (outline,) = plt.gca().collections
+        self.assertEqual(len(outline.get_segments()), 4)
+        np.testing.assert_array_equal(
+            polygon.extract_vectors(), [[0, 0], [2, 0], [2, 2], [0, 2]]
+        )
+
+
+class TestArrow(unittest.TestCase):
+    """Tests for the rendering of Arrow figures."""
+
+    def tearDown(self) -> None:
+        plt.close("all")
+
+    def test_zero_length(self):
+        with self.assertRaises(ValueError):
+            Arrow((1, 1), (1, 1)).render()
+
+    def test_tip_setter_resyncs(self):
+        arrow = Arrow((1, 1))
+        arrow.tip = (2, 3)
+        arrow.tail = (1, 1)
+        np.testing.assert_array_equal(arrow.extract_vectors(), [[2, 3], [1, 1]])
+
+    def test_one_patch_per_arrow(self):
+        Arrow.render_all([Arrow((1, 1)), Arrow((2, 0), (1, 1))], {})
+        (patches,) = plt.gca().collections
+        self.assertIsInstance(patches, PatchCollection)
+        self.assertEqual(len(patches.get_paths()), 2)
+
+
+class TestDraw(unittest.TestCase):
+    """Tests for the batched rendering and the options of draw()."""
+
+    def tearDown(self) -> None:
+        plt.close("all")
+
+    @staticmethod
+    def _figures():
+        return [
+            *(Segment((0, 0), (i, 1)) for i in range(5)),
+            *(Arrow((i, 2)) for i in range(1, 4)),
+            Points((1, 1), (2, 2)),
+            Points((3, 3)),
+        ]
+
+    def test_one_collection_per_figure_type(self):
+        draw(*self._figures(), origin=False, axes=False)
+        collection_types = sorted(
+            type(c).__name__ for c in plt.gca().collections
+        )
+        self.assertEqual(
+            collection_types,
+            sorted(
+                cls.__name__
+                for cls in (LineCollection, PatchCollection, PathCollection)
+            ),
+        )
+
+    def test_not_rasterized_without_save_as(self):
+        draw(*self._figures(), origin=False, axes=False)
+        for collection in plt.gca().collections:
+            self.assertFalse(collection.get_rasterized())
+
+    def test_rasterized_with_save_as(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            draw(
+                *self._figures(),
+                origin=False,
+                axes=False,
+                save_as=os.path.join(tmp_dir, "figures.svg"),
+            )
+        for collection in plt.gca().collections:
+            self.assertTrue(collection.get_rasterized())
+
+    def test_rasterize_figures_disabled(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            draw(
+                *self._figures(),
+                origin=False,
+                axes=False,
+                save_as=os.path.join(tmp_dir, "figures.svg"),
+                rasterize_figures=False,
+            )
+        for collection in plt.gca().collections:
+            self.assertFalse(collection.get_rasterized())
+
+
+if __name__ == "__main__":
+    unittest.main()
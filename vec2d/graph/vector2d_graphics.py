@@ -6,14 +6,21 @@ colors, and a function draw() to render the figures.
 """
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from enum import Enum
-from math import ceil, floor, sqrt
+from itertools import count
+from math import ceil, floor
 from typing import Optional, Sequence
 
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.collections import PatchCollection
-from matplotlib.patches import Polygon as pyplot_poly
+from matplotlib.collections import (
+    LineCollection,
+    PatchCollection,
+    PolyCollection,
+)
+from matplotlib.colors import is_color_like, to_rgba
+from matplotlib.patches import FancyArrow
 from matplotlib.pyplot import xlim, ylim
 
 logging.basicConfig(
@@ -62,34 +69,103 @@ class Figure2D(ABC):
     """
 
     @abstractmethod
-    def extract_vectors(self) -> tuple[int | float, int | float]:
-        """Generator function that returns the vectors (points) that define the
-        figure.
+    def extract_vectors(self) -> np.ndarray:
+        """Returns the vectors (points) that define the figure.
 
         Returns:
-            tuple[int | float, int | float]: a tuple with the corresponding
-                vector coordinates in the 2D plane.
+            np.ndarray: a read-only (N, 2) array with the corresponding vector
+                coordinates in the 2D plane.
+        """
+
+    @classmethod
+    def render_all(
+        cls, figures: Sequence["Figure2D"], ctx: Optional[dict] = None
+    ) -> None:
+        """Performs the necessary actions on Matplotlib to render all the given
+        figures of this type on screen at once, so that a single Matplotlib
+        artist is created for the whole batch instead of one per figure.
+
+        Args:
+            figures (Sequence[Figure2D]): the figures of this type to be
+                rendered.
+            ctx (dict, optional): the rendering context computed once by
+                draw() and shared by all the figures. It may contain the "ax"
+                key with the Matplotlib Axes to draw on, the "xlim_span" key
+                with the width of the x-axis limits, and the "rasterized" key
+                to rasterize the artists when saved to a vector graphics
+                format. Missing values are computed from the current
+                Matplotlib state.
+
+        By default, each figure is rendered on its own using render(), so that
+        figures that only implement render() can still be drawn.
         """
+        # pylint: disable=unused-argument
+        for figure in figures:
+            figure.render()
 
     @abstractmethod
-    def render(self) -> None:
+    def render(self, ctx: Optional[dict] = None) -> None:
         """Performs the necessary actions on Matplotlib to render the
         corresponding figure on screen.
+
+        Args:
+            ctx (dict, optional): the rendering context, as described in
+                render_all().
         """
 
-    def normalize_color(self, color):
+    @staticmethod
+    def normalize_color(color):
         """Normalize the color with which a Figure2D has been initialized so
         that it matches Matplotlib's native handling of colors. That way, either
         a color from Colors enumeration, a Matplotlib color, or a value from a
         colormap can be used."""
-        return color.value if hasattr(color, "value") else color
+        return color.value if isinstance(color, Enum) else color
 
-    def normalize_linestyle(self, linestyle):
+    @staticmethod
+    def normalize_linestyle(linestyle):
         """Normalize the linestyle with which a Figure2D has been initialized so
         that it matches Matplotlib's native handling of linestyles. That way,
         either a linestyle from LineStyles enumeration or a native Matplotlib
         linestyle can be used."""
-        return linestyle.value if hasattr(linestyle, "value") else linestyle
+        return linestyle.value if isinstance(linestyle, Enum) else linestyle
+
+    @staticmethod
+    def _to_xy(vectors) -> np.ndarray:
+        """Returns the given vectors as a new read-only (N, 2) float array, so
+        that the array handed out by extract_vectors() cannot be used to
+        modify the figure.
+
+        Raises:
+            ValueError: if the given vectors are not 2D vectors.
+        """
+        xy = np.array(vectors, dtype=float)
+        if xy.size == 0:
+            xy = np.empty((0, 2))
+        elif xy.ndim != 2 or xy.shape[1] != 2:
+            raise ValueError(
+                f"expected a sequence of 2D vectors, got shape {xy.shape}"
+            )
+        xy.flags.writeable = False
+        return xy
+
+    @staticmethod
+    def _resolve_colors(colors: Sequence) -> list:
+        """Replaces the None values in the given colors with the successive
+        colors of the property cycle, as Matplotlib does for a plot with no
+        explicit color, so that the colors can be used in a collection."""
+        cycle = (f"C{i}" for i in count())
+        return [next(cycle) if color is None else color for color in colors]
+
+    @staticmethod
+    def _resolve_linestyles(linestyles: Sequence) -> list:
+        """Replaces the None values in the given linestyles with the default
+        Matplotlib linestyle, as Matplotlib does for a plot with no explicit
+        linestyle, so that the linestyles can be used in a collection."""
+        default = plt.rcParams["lines.linestyle"]
+        return [
+            default if linestyle is None else linestyle
+            for linestyle in linestyles
+        ]
 
 
 class Points(Figure2D):
@@ -101,17 +177,55 @@ class Points(Figure2D):
     def __init__(
         self, *vectors: tuple[int | float, int | float], color=Colors.BLACK
     ) -> None:
-        self.vectors = list(vectors)
+        self._vectors = vectors
+        self._xy = self._to_xy(vectors)
         self.color = self.normalize_color(color)
 
-    def extract_vectors(self) -> tuple[int | float, int | float]:
-        for v in self.vectors:
-            yield v
+    @property
+    def vectors(self) -> tuple[tuple[int | float, int | float], ...]:
+        """The vectors (points) of the collection."""
+        return self._vectors
 
-    def render(self) -> None:
-        xs = [v[0] for v in self.vectors]
-        ys = [v[1] for v in self.vectors]
-        plt.scatter(xs, ys, color=self.color)
+    @vectors.setter
+    def vectors(
+        self, vectors: tuple[tuple[int | float, int | float], ...]
+    ) -> None:
+        self._vectors = vectors
+        self._xy = self._to_xy(vectors)
+
+    def extract_vectors(self) -> np.ndarray:
+        return self._xy
+
+    def render(self, ctx: Optional[dict] = None) -> None:
+        self.render_all([self], ctx)
+
+    @classmethod
+    def render_all(
+        cls, figures: Sequence["Points"], ctx: Optional[dict] = None
+    ) -> None:
+        ctx = ctx or {}
+        ax = ctx.get("ax") or plt.gca()
+        # pylint: disable=protected-access
+        xy = np.concatenate([points._xy for points in figures])
+        colors = []
+        for points, color in zip(
+            figures, cls._resolve_colors([p.color for p in figures])
+        ):
+            if is_color_like(color):
+                colors.extend([color] * len(points._xy))
+            elif len(color) == len(points._xy):
+                colors.extend(color)
+            else:
+                raise ValueError(
+                    f"expected a single color or {len(points._xy)} colors, "
+                    f"got {len(color)} colors"
+                )
+        ax.scatter(
+            xy[:, 0],
+            xy[:, 1],
+            color=colors,
+            rasterized=ctx.get("rasterized", False),
+        )
 
 
 class Segment(Figure2D):
@@ -128,19 +242,58 @@ class Segment(Figure2D):
         color: Colors = Colors.BLUE,
         linestyle: LineStyles = LineStyles.SOLID,
     ) -> None:
-        self.start_point = start_point
-        self.end_point = end_point
+        self._start_point = start_point
+        self._end_point = end_point
+        self._xy = self._to_xy([start_point, end_point])
         self.color = self.normalize_color(color)
         self.linestyle = self.normalize_linestyle(linestyle)
 
-    def extract_vectors(self) -> tuple[int | float, int | float]:
-        yield self.start_point
-        yield self.end_point
+    @property
+    def start_point(self) -> tuple[int | float, int | float]:
+        """The start point of the segment."""
+        return self._start_point
+
+    @start_point.setter
+    def start_point(self, start_point: tuple[int | float, int | float]) -> None:
+        self._start_point = start_point
+        self._xy = self._to_xy([start_point, self._end_point])
 
-    def render(self) -> None:
-        x1, y1 = self.start_point
-        x2, y2 = self.end_point
-        plt.plot([x1, x2], [y1, y2], color=self.color, linestyle=self.linestyle)
+    @property
+    def end_point(self) -> tuple[int | float, int | float]:
+        """The end point of the segment."""
+        return self._end_point
+
+    @end_point.setter
+    def end_point(self, end_point: tuple[int | float, int | float]) -> None:
+        self._end_point = end_point
+        self._xy = self._to_xy([self._start_point, end_point])
+
+    def extract_vectors(self) -> np.ndarray:
+        return self._xy
+
+    def render(self, ctx: Optional[dict] = None) -> None:
+        self.render_all([self], ctx)
+
+    @classmethod
+    def render_all(
+        cls, figures: Sequence["Segment"], ctx: Optional[dict] = None
+    ) -> None:
+        ctx = ctx or {}
+        ax = ctx.get("ax") or plt.gca()
+        # pylint: disable=protected-access
+        segments = np.stack([segment._xy for segment in figures])
+        ax.add_collection(
+            LineCollection(
+                segments,
+                colors=cls._resolve_colors(
+                    [segment.color for segment in figures]
+                ),
+                linestyles=cls._resolve_linestyles(
+                    [segment.linestyle for segment in figures]
+                ),
+                rasterized=ctx.get("rasterized", False),
+            )
+        )
 
 
 class Polygon(Figure2D):
@@ -161,34 +314,78 @@ class Polygon(Figure2D):
         alpha=0.4,
         linestyle=LineStyles.SOLID,
     ) -> None:
-        self.vertices = vertices
+        self._vertices = vertices
+        self._xy = self._to_xy(vertices)
         self.color = self.normalize_color(color)
         self.fill = self.normalize_color(fill)
         self.alpha = alpha
         self.linestyle = self.normalize_linestyle(linestyle)
 
-    def extract_vectors(self) -> tuple[int | float, int | float]:
-        for v in self.vertices:  # pylint: disable=invalid-name
-            yield v
-
-    def render(self) -> None:
-        if self.color:
-            for i in range(0, len(self.vertices)):
-                x1, y1 = self.vertices[i]
-                x2, y2 = self.vertices[(i + 1) % len(self.vertices)]
-                plt.plot(
-                    [x1, x2],
-                    [y1, y2],
-                    color=self.color,
-                    linestyle=self.linestyle,
-                )
+    @property
+    def vertices(self) -> tuple[tuple[int | float, int | float], ...]:
+        """The vertices of the polygon."""
+        return self._vertices
+
+    @vertices.setter
+    def vertices(
+        self, vertices: tuple[tuple[int | float, int | float], ...]
+    ) -> None:
+        self._vertices = vertices
+        self._xy = self._to_xy(vertices)
 
-        if self.fill:
-            patches = []
-            poly = pyplot_poly(self.vertices, closed=True)
-            patches.append(poly)
-            patch_collection = PatchCollection(patches, color=self.fill)
-            plt.gca().add_collection(patch_collection)
+    def extract_vectors(self) -> np.ndarray:
+        return self._xy
+
+    def render(self, ctx: Optional[dict] = None) -> None:
+        self.render_all([self], ctx)
+
+    @classmethod
+    def render_all(
+        cls, figures: Sequence["Polygon"], ctx: Optional[dict] = None
+    ) -> None:
+        ctx = ctx or {}
+        ax = ctx.get("ax") or plt.gca()
+        # pylint: disable=protected-access
+        outlined = [polygon for polygon in figures if polygon.color]
+        if outlined:
+            segments = []
+            for polygon in outlined:
+                segments.append(
+                    np.stack(
+                        [polygon._xy, np.roll(polygon._xy, -1, axis=0)], axis=1
+                    )
+                )
+            ax.add_collection(
+                LineCollection(
+                    np.concatenate(segments),
+                    colors=[
+                        polygon.color
+                        for polygon in outlined
+                        for _ in range(len(polygon._xy))
+                    ],
+                    linestyles=cls._resolve_linestyles(
+                        [
+                            polygon.linestyle
+                            for polygon in outlined
+                            for _ in range(len(polygon._xy))
+                        ]
+                    ),
+                    rasterized=ctx.get("rasterized", False),
+                )
+            )
+
+        filled = [polygon for polygon in figures if polygon.fill]
+        if filled:
+            ax.add_collection(
+                PolyCollection(
+                    [polygon._xy for polygon in filled],
+                    color=[
+                        to_rgba(polygon.fill, polygon.alpha)
+                        for polygon in filled
+                    ],
+                    rasterized=ctx.get("rasterized", False),
+                )
+            )
 
 
 class Arrow(Figure2D):
@@ -206,32 +403,80 @@ class Arrow(Figure2D):
         color=Colors.RED,
         linestyle=LineStyles.SOLID,
     ) -> None:
-        self.tip = tip
-        self.tail = tail
+        self._tip = tip
+        self._tail = tail
+        self._xy = self._to_xy([tip, tail])
         self.color = self.normalize_color(color)
         self.linestyle = self.normalize_linestyle(linestyle)
 
-    def extract_vectors(self) -> tuple[int | float, int | float]:
-        yield self.tip
-        yield self.tail
-
-    def render(self) -> None:
-        tip, tail = self.tip, self.tail
-        tip_length = (xlim()[1] - xlim()[0]) / 20.0
-        length = sqrt((tip[1] - tail[1]) ** 2 + (tip[0] - tail[0]) ** 2)
-        new_length = length - tip_length
-        new_y = (tip[1] - tail[1]) * (new_length / length)
-        new_x = (tip[0] - tail[0]) * (new_length / length)
-        plt.gca().arrow(
-            tail[0],
-            tail[1],
-            new_x,
-            new_y,
-            head_width=tip_length / 1.5,
-            head_length=tip_length,
-            fc=self.color,
-            ec=self.color,
-            linestyle=self.linestyle,
+    @property
+    def tip(self) -> tuple[int | float, int | float]:
+        """The tip of the arrow."""
+        return self._tip
+
+    @tip.setter
+    def tip(self, tip: tuple[int | float, int | float]) -> None:
+        self._tip = tip
+        self._xy = self._to_xy([tip, self._tail])
+
+    @property
+    def tail(self) -> tuple[int | float, int | float]:
+        """The tail of the arrow."""
+        return self._tail
+
+    @tail.setter
+    def tail(self, tail: tuple[int | float, int | float]) -> None:
+        self._tail = tail
+        self._xy = self._to_xy([self._tip, tail])
+
+    def extract_vectors(self) -> np.ndarray:
+        return self._xy
+
+    def render(self, ctx: Optional[dict] = None) -> None:
+        self.render_all([self], ctx)
+
+    @classmethod
+    def render_all(
+        cls, figures: Sequence["Arrow"], ctx: Optional[dict] = None
+    ) -> None:
+        ctx = ctx or {}
+        ax = ctx.get("ax") or plt.gca()
+        xlim_span = ctx.get("xlim_span")
+        if xlim_span is None:
+            xlim_span = xlim()[1] - xlim()[0]
+        tip_length = xlim_span / 20.0
+
+        # pylint: disable=protected-access
+        xy = np.stack([arrow._xy for arrow in figures])
+        tails = xy[:, 1]
+        deltas = xy[:, 0] - tails
+        lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+        if (lengths == 0).any():
+            raise ValueError(
+                "cannot draw an arrow whose tip and tail are the same point"
+            )
+        deltas *= ((lengths - tip_length) / lengths)[:, np.newaxis]
+
+        arrows = [
+            FancyArrow(
+                tail[0],
+                tail[1],
+                delta[0],
+                delta[1],
+                head_width=tip_length / 1.5,
+                head_length=tip_length,
+                fc=arrow.color,
+                ec=arrow.color,
+                linestyle=arrow.linestyle,
+            )
+            for arrow, tail, delta in zip(figures, tails, deltas)
+        ]
+        ax.add_collection(
+            PatchCollection(
+                arrows,
+                match_original=True,
+                rasterized=ctx.get("rasterized", False),
+            )
         )
 
 
@@ -243,6 +488,7 @@ def draw(
     nice_aspect_ratio=True,
     width=6,
     save_as: str = None,
+    rasterize_figures: bool = True,
 ):
     """Draws the given objects as a Matplotlib object with the given
     configuration
@@ -268,15 +514,23 @@ def draw(
             monitors and 2D drawings.
         save_as (str, optional): path of the file to be created with the plot,
             or None if no file is to be created.
+        rasterize_figures (bool, optional): whether to rasterize the figures
+            when the plot is saved with save_as, while keeping the axes, ticks
+            and labels as vector graphics. This keeps vector formats such as
+            SVG or PDF small for plots with many figures. Default is True.
     """
-    all_vectors = [vec for obj in objects for vec in obj.extract_vectors()]
-    xs, ys = zip(*all_vectors)  # pylint: disable=invalid-name
-    max_x, max_y, min_x, min_y = (
-        max(0, *xs),
-        max(0, *ys),
-        min(0, *xs),
-        min(0, *ys),
-    )
+    ax = plt.gca()
+
+    arrays = [obj.extract_vectors() for obj in objects]
+    all_vectors = np.empty((sum(arr.shape[0] for arr in arrays), 2))
+    start = 0
+    for arr in arrays:
+        end = start + arr.shape[0]
+        all_vectors[start:end] = arr
+        start = end
+
+    max_x, max_y = np.maximum(all_vectors.max(axis=0), 0).tolist()
+    min_x, min_y = np.minimum(all_vectors.min(axis=0), 0).tolist()
 
     if grid:
         x_padding = max(ceil(0.05 * (max_x - min_x)), grid[0])
@@ -301,22 +555,32 @@ def draw(
         plt.scatter([0], [0], color=Colors.BLACK.value, marker="x")
 
     if grid:
-        plt.gca().set_xticks(np.arange(plt.xlim()[0], plt.xlim()[1], grid[0]))
-        plt.gca().set_yticks(np.arange(plt.ylim()[0], plt.ylim()[1], grid[1]))
-        plt.grid(True)
-        plt.gca().set_axisbelow(True)
+        ax.set_xticks(np.arange(*ax.get_xlim(), grid[0]))
+        ax.set_yticks(np.arange(*ax.get_ylim(), grid[1]))
+        ax.grid(True)
+        ax.set_axisbelow(True)
 
     if axes:
-        plt.gca().axhline(linewidth=2, color=Colors.BLACK.value)
-        plt.gca().axvline(linewidth=2, color=Colors.BLACK.value)
+        ax.axhline(linewidth=2, color=Colors.BLACK.value)
+        ax.axvline(linewidth=2, color=Colors.BLACK.value)
+
+    ctx = {
+        "ax": ax,
+        "xlim_span": xlim()[1] - xlim()[0],
+        "rasterized": bool(save_as) and rasterize_figures,
+    }
 
     if nice_aspect_ratio:
         coords_height = ylim()[1] - ylim()[0]
-        coords_width = xlim()[1] - xlim()[0]
+        coords_width = ctx["xlim_span"]
         plt.gcf().set_size_inches(width, width * coords_height / coords_width)
 
+    figures_by_type = defaultdict(list)
     for obj in objects:
-        obj.render()
+        figures_by_type[type(obj)].append(obj)
+
+    for figure_type, figures in figures_by_type.items():
+        figure_type.render_all(figures, ctx)
 
     if save_as:
         plt.savefig(save_as)
@@ -0,0 +1,141 @@
+"""
+Compiled kernels for the batch versions of the math functions of the
+vec2d.math module. The kernels operate on (N, 2) float64 arrays of vectors.
+If Numba is installed, they are JIT-compiled loops; otherwise, they are
+vectorized NumPy expressions.
+"""
+from math import atan2, cos, hypot, pi, sin
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _length(v: np.ndarray) -> np.ndarray:
+        """Calculates the length of each of the given vectors.
+
+        Args:
+            v (np.ndarray): the (N, 2) array of vectors.
+
+        Returns:
+            np.ndarray: the (N,) array with the length of each vector.
+        """
+        n = v.shape[0]
+        lengths = np.empty(n)
+        for i in prange(n):  # pylint: disable=not-an-iterable
+            lengths[i] = hypot(v[i, 0], v[i, 1])
+        return lengths
+
+    @njit(parallel=True, cache=True)
+    def _perimeter(v: np.ndarray) -> float:
+        """Computes the perimeter of the shape defined by the given vectors.
+
+        Args:
+            v (np.ndarray): the (N, 2) array of vectors/points that define the
+                2D shape.
+
+        Returns:
+            float: the perimeter of the 2D shape
+        """
+        n = v.shape[0]
+        total = 0.0
+        for i in prange(n):  # pylint: disable=not-an-iterable
+            j = (i + 1) % n
+            total += hypot(v[i, 0] - v[j, 0], v[i, 1] - v[j, 1])
+        return total
+
+    @njit(parallel=True, cache=True)
+    def _rotate(angle: float, v: np.ndarray) -> np.ndarray:
+        """Rotates the given vectors by the given angle about the origin.
+
+        Args:
+            angle (float): the angle (in radians) that will be used in the
+                rotation
+            v (np.ndarray): the (N, 2) array of vectors to be rotated.
+
+        Returns:
+            np.ndarray: the (N, 2) array of rotated vectors.
+        """
+        c, s = cos(angle), sin(angle)
+        n = v.shape[0]
+        rotated = np.empty((n, 2))
+        for i in prange(n):  # pylint: disable=not-an-iterable
+            rotated[i, 0] = c * v[i, 0] - s * v[i, 1]
+            rotated[i, 1] = s * v[i, 0] + c * v[i, 1]
+        return rotated
+
+    @njit(parallel=True, cache=True)
+    def _to_polar(v: np.ndarray, positive_angle: bool) -> np.ndarray:
+        """Returns the polar coordinates (r, θ) of the given vectors.
+
+        Args:
+            v (np.ndarray): the (N, 2) array of vectors in Cartesian
+                coordinates.
+            positive_angle (bool): forces the angles to have a positive value.
+
+        Returns:
+            np.ndarray: the (N, 2) array of vectors in polar coordinates.
+        """
+        n = v.shape[0]
+        polar = np.empty((n, 2))
+        for i in prange(n):  # pylint: disable=not-an-iterable
+            angle = atan2(v[i, 1], v[i, 0])
+            if positive_angle and angle < 0:
+                angle += 2 * pi
+            polar[i, 0] = hypot(v[i, 0], v[i, 1])
+            polar[i, 1] = angle
+        return polar
+
+    @njit(parallel=True, cache=True)
+    def _to_cartesian(v: np.ndarray) -> np.ndarray:
+        """Returns the Cartesian coordinates (x, y) of the given vectors.
+
+        Args:
+            v (np.ndarray): the (N, 2) array of vectors in polar coordinates.
+
+        Returns:
+            np.ndarray: the (N, 2) array of vectors in Cartesian coordinates.
+        """
+        n = v.shape[0]
+        cartesian = np.empty((n, 2))
+        for i in prange(n):  # pylint: disable=not-an-iterable
+            cartesian[i, 0] = v[i, 0] * cos(v[i, 1])
+            cartesian[i, 1] = v[i, 0] * sin(v[i, 1])
+        return cartesian
+
+else:
+
+    def _length(v: np.ndarray) -> np.ndarray:
+        """NumPy version of the _length kernel."""
+        return np.hypot(v[:, 0], v[:, 1])
+
+    def _perimeter(v: np.ndarray) -> float:
+        """NumPy version of the _perimeter kernel."""
+        d = v - np.roll(v, -1, axis=0)
+        return np.hypot(d[:, 0], d[:, 1]).sum()
+
+    def _rotate(angle: float, v: np.ndarray) -> np.ndarray:
+        """NumPy version of the _rotate kernel."""
+        c, s = cos(angle), sin(angle)
+        return v @ np.array([[c, -s], [s, c]]).T
+
+    def _to_polar(v: np.ndarray, positive_angle: bool) -> np.ndarray:
+        """NumPy version of the _to_polar kernel."""
+        angles = np.arctan2(v[:, 1], v[:, 0])
+        if positive_angle:
+            angles = np.where(angles < 0, angles + 2 * pi, angles)
+        return np.column_stack([np.hypot(v[:, 0], v[:, 1]), angles])
+
+    def _to_cartesian(v: np.ndarray) -> np.ndarray:
+        """NumPy version of the _to_cartesian kernel."""
+        return np.column_stack(
+            [v[:, 0] * np.cos(v[:, 1]), v[:, 0] * np.sin(v[:, 1])]
+        )
@@ -1,7 +1,36 @@
 """
 A library providing a few Math related functions for the 2D plane.
 """
-from math import atan2, cos, pi, sin, sqrt
+from math import atan2, cos, hypot, pi, sin
+
+import numpy as np
+
+from vec2d.math._vec_numba import (
+    _length,
+    _perimeter,
+    _rotate,
+    _to_cartesian,
+    _to_polar,
+)
+
+
+def _as_batch(vectors, collection: bool = False) -> np.ndarray | None:
+    """Returns the given vectors as a contiguous (N, 2) float64 array if they
+    are given as a 2-dimensional NumPy array, so that they can be handed to the
+    compiled kernels, or None otherwise. If collection is True, the vectors are
+    expected to be a collection of vectors, so that any array that is not
+    (N, 2) is rejected, instead of being treated as a single vector.
+
+    Raises:
+        ValueError: if an array whose rows are not 2D vectors is given.
+    """
+    if isinstance(vectors, np.ndarray) and (vectors.ndim == 2 or collection):
+        if vectors.ndim != 2 or vectors.shape[1] != 2:
+            raise ValueError(
+                f"expected an (N, 2) array of vectors, got {vectors.shape}"
+            )
+        return np.ascontiguousarray(vectors, dtype=np.float64)
+    return None
 
 
 def add(
@@ -30,19 +59,31 @@ def add_mult(*v: tuple[int | float, int | float]) -> tuple[int | float]:
     """
     if len(v) < 2:
         raise ValueError("at least two vectors were expected")
-    return (sum([x for x, _ in v]), sum([y for _, y in v]))
+    sum_x = sum_y = 0
+    for x, y in v:
+        sum_x += x
+        sum_y += y
+    return (sum_x, sum_y)
 
 
-def length(v: tuple[int | float, int | float]) -> float:
-    """Calculates the length of a vector
+def length(
+    v: tuple[int | float, int | float] | np.ndarray,
+) -> float | np.ndarray:
+    """Calculates the length of a vector. If an (N, 2) array of vectors is
+    given, the array with the lengths of all the vectors is returned.
 
     Args:
-        v (tuple[int | float, int | float]): the 2D vector
+        v (tuple[int | float, int | float] | np.ndarray): the 2D vector, or an
+            (N, 2) array of 2D vectors
 
     Returns:
-        float: the length of the vector
+        float | np.ndarray: the length of the vector, or the (N,) array with
+            the lengths of the vectors
     """
-    return sqrt(v[0] ** 2 + v[1] ** 2)
+    batch = _as_batch(v)
+    if batch is not None:
+        return _length(batch)
+    return hypot(v[0], v[1])
 
 
 def scalar_product(
@@ -148,124 +189,165 @@ def distance(
 
 def translate(
     translation_vector: tuple[int | float, int | float],
-    vectors: list[tuple[int | float, int | float]],
-) -> list[tuple[int | float, int | float]]:
+    vectors: list[tuple[int | float, int | float]] | np.ndarray,
+) -> list[tuple[int | float, int | float]] | np.ndarray:
     """Takes a translation vector and a list of input vectors and returns a list
-    of the input vectors all translated by the translated vector.
+    of the input vectors all translated by the translated vector. If the
+    vectors are given as an (N, 2) array, the translated vectors are returned
+    as an array too.
 
     Args:
         translation_vector (tuple[int | float, int | float]): the translation
             vector
-        vectors (list[tuple[int | float, int | float]]): the list of vectors to
-            be translated
+        vectors (list[tuple[int | float, int | float]] | np.ndarray): the list
+            of vectors to be translated
 
     Returns:
-        list[tuple[int | float, int | float]]: the list of vectors that results
-            from translating all the given vectors.
+        list[tuple[int | float, int | float]] | np.ndarray: the list (or
+            (N, 2) array) of vectors that results from translating all the
+            given vectors.
     """
     if len(vectors) == 0:
         raise ValueError("expected a non-empty list of vectors")
 
+    batch = _as_batch(vectors, collection=True)
+    if batch is not None:
+        return batch + np.asarray(translation_vector, dtype=np.float64)
+
     return [add(translation_vector, v) for v in vectors]
 
 
 def rotate(
     angle: float,
-    vectors: list[tuple[int | float, int | float]],
-) -> list[tuple[int | float, int | float]]:
+    vectors: list[tuple[int | float, int | float]] | np.ndarray,
+) -> list[tuple[int | float, int | float]] | np.ndarray:
     """Takes an angle in radians and a list of input vectors and returns a list
     of the input vectors all of them rotated by the given angle counterclockwise
     about the origin if the given angle is positive, or clockwise if the given
-    angle is negative.
+    angle is negative. If the vectors are given as an (N, 2) array, the rotated
+    vectors are returned as an array too.
 
     Args:
         angle (float): the angle (in radians) that will be used in the rotation
-        vectors (list[tuple[int | float, int | float]]): the list of vectors,
-        given their Cartesian coordinates, to be rotated
+        vectors (list[tuple[int | float, int | float]] | np.ndarray): the list
+        of vectors, given their Cartesian coordinates, to be rotated
 
     Returns:
-        list[tuple[int | float, int | float]]: the list of vectors that results
-            from rotating all the given vectors by the given angle.
+        list[tuple[int | float, int | float]] | np.ndarray: the list (or (N, 2)
+            array) of vectors that results from rotating all the given vectors
+            by the given angle.
     """
     if len(vectors) == 0:
         raise ValueError("expected a non-empty list of vectors")
 
-    vectors_polar = [to_polar(v) for v in vectors]
-    return [to_cartesian((r, theta + angle)) for r, theta in vectors_polar]
+    batch = _as_batch(vectors, collection=True)
+    if batch is not None:
+        return _rotate(angle, batch)
+
+    c, s = cos(angle), sin(angle)
+    return [(c * x - s * y, s * x + c * y) for x, y in vectors]
 
 
 def rescale(
     factor: float,
-    vectors: list[tuple[int | float, int | float]],
-) -> list[tuple[int | float, int | float]]:
+    vectors: list[tuple[int | float, int | float]] | np.ndarray,
+) -> list[tuple[int | float, int | float]] | np.ndarray:
     """Takes a scaling factor and a list of input vectors and returns a list
-    of the input vectors all of them scaled by the given factor.
+    of the input vectors all of them scaled by the given factor. If the vectors
+    are given as an (N, 2) array, the scaled vectors are returned as an array
+    too.
 
     Args:
         factor (float): the factor to be used when scaling.
-        vectors (list[tuple[int | float, int | float]]): the list of vectors in
-        to Cartesian coordinates to be rotated
+        vectors (list[tuple[int | float, int | float]] | np.ndarray): the list
+        of vectors in to Cartesian coordinates to be rotated
 
     Returns:
-        list[tuple[int | float, int | float]]: the list of vectors that results
-            from scaling all the given vectors by the given factor.
+        list[tuple[int | float, int | float]] | np.ndarray: the list (or
+            (N, 2) array) of vectors that results from scaling all the given
+            vectors by the given factor.
     """
     if len(vectors) == 0:
         raise ValueError("expected a non-empty list of vectors")
 
+    batch = _as_batch(vectors, collection=True)
+    if batch is not None:
+        return factor * batch
+
     return [scale(factor, v) for v in vectors]
 
 
-def perimeter(vectors: list[tuple[int | float, int | float]]) -> int | float:
+def perimeter(
+    vectors: list[tuple[int | float, int | float]] | np.ndarray,
+) -> int | float:
     """Computes the perimeter of the shape defined by the given vectors.
 
     Args:
-        vectors (list[tuple[int | float, int | float]]): the list of vectors/
-            points that define the 2D shape.
+        vectors (list[tuple[int | float, int | float]] | np.ndarray): the list
+            of vectors/points that define the 2D shape.
 
     Returns:
         int | float: the perimeter of the 2D shape
     """
-    distances = [
-        distance(vectors[i], vectors[(i + 1) % len(vectors)])
-        for i in range(0, len(vectors))
-    ]
-    return sum(distances)
+    if len(vectors) == 0:
+        return 0
 
+    batch = _as_batch(vectors, collection=True)
+    if batch is not None:
+        return float(_perimeter(batch))
 
-def to_cartesian(polar_vector: tuple[float, float]) -> tuple[float, float]:
+    return sum(
+        hypot(x1 - x2, y1 - y2)
+        for (x1, y1), (x2, y2) in zip(vectors, [*vectors[1:], vectors[0]])
+    )
+
+
+def to_cartesian(
+    polar_vector: tuple[float, float] | np.ndarray,
+) -> tuple[float, float] | np.ndarray:
     """Returns the Cartesian coordinates (x, y) of a vector given its polar
     coordinates (r, θ), where r is the length of the vector and the angle θ is
     expressed in radians, measured counterclockwise from the positive x axis.
+    If an (N, 2) array of vectors is given, an array is returned.
 
     Args:
-        polar_vector (tuple[float, float]): the vector in polar coordinates
-            (radius and angle).
+        polar_vector (tuple[float, float] | np.ndarray): the vector in polar
+            coordinates (radius and angle).
 
     Returns:
-        tuple[float, float]: the Cartesian coordinates (x, y) of the vector.
+        tuple[float, float] | np.ndarray: the Cartesian coordinates (x, y) of
+            the vector, or the (N, 2) array of Cartesian coordinates.
     """
+    batch = _as_batch(polar_vector)
+    if batch is not None:
+        return _to_cartesian(batch)
+
     l, a = polar_vector
     return (l * cos(a), l * sin(a))
 
 
 def to_polar(
-    cartesian_vector: tuple[float, float], positive_angle=False
-) -> tuple[float, float]:
+    cartesian_vector: tuple[float, float] | np.ndarray, positive_angle=False
+) -> tuple[float, float] | np.ndarray:
     """Returns the polar coordinates (r, θ) of a vector, where r is the length
     of the vector and the angle θ is expressed in radians, measured
     counterclockwise from the positive x axis given its Cartesian coordinates
-    (x, y).
+    (x, y). If an (N, 2) array of vectors is given, an array is returned.
 
     Args:
-        cartesian_vector (tuple[float, float]): the vector in Cartesian
-        coordinates (x, y).
+        cartesian_vector (tuple[float, float] | np.ndarray): the vector in
+        Cartesian coordinates (x, y).
         positive_angle (bool, Optional): forces the angle to have a positive
             value. Otherwise, angles greater than pi will have negative values.
 
     Returns:
-        tuple[float, float]: the polar coordinates (r, θ) of the vector.
+        tuple[float, float] | np.ndarray: the polar coordinates (r, θ) of the
+            vector, or the (N, 2) array of polar coordinates.
     """
+    batch = _as_batch(cartesian_vector)
+    if batch is not None:
+        return _to_polar(batch, positive_angle)
+
     x, y = cartesian_vector
     angle = atan2(y, x)
     if positive_angle and angle < 0: